@@ -1,6 +1,6 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, ForeignKey, inspect, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
 from pydantic import BaseModel
@@ -44,6 +44,7 @@ class Word(Base):
     definitions = Column(Text)  # JSON格式
     pos_tags = Column(String)   # 词性标签
     difficulty_level = Column(String, default="unknown")
+    frequency_rank = Column(Integer, index=True)  # 词频排名，1为最常用
     examples = Column(Text)     # JSON格式
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow)
@@ -69,6 +70,16 @@ class WordRecord(Base):
 # 创建数据库表
 Base.metadata.create_all(bind=engine)
 
+def ensure_word_frequency_columns():
+    """为旧数据库补充词频列及其索引（create_all不会修改已存在的表）"""
+    columns = {column["name"] for column in inspect(engine).get_columns("words")}
+    with engine.begin() as conn:
+        if "frequency_rank" not in columns:
+            conn.execute(text("ALTER TABLE words ADD COLUMN frequency_rank INTEGER"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_words_frequency_rank ON words (frequency_rank)"))
+
+ensure_word_frequency_columns()
+
 # Pydantic模型
 class WordDefinition(BaseModel):
     word: str
@@ -90,6 +101,8 @@ class WordResponse(BaseModel):
     definitions: List[dict]
     examples: List[str]
     pos_tags: Optional[str]
+    difficulty_level: str = "unknown"
+    frequency_rank: Optional[int] = None
     mastery_level: int = 0
     review_count: int = 0
     created_at: datetime
@@ -132,6 +145,100 @@ class DictionaryConfig:
 # 全局配置实例
 dictionary_config = DictionaryConfig()
 
+# 词频表配置
+WORD_FREQUENCY_FILE = os.getenv(
+    "WORD_FREQUENCY_FILE",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "word_frequency.txt")
+)
+
+# 难度等级划分：(排名上限, 难度等级)
+DIFFICULTY_THRESHOLDS = [
+    (1000, "basic"),
+    (5000, "intermediate"),
+    (20000, "advanced"),
+]
+
+class WordFrequencyTable:
+    """离线词频表：单词按排名顺序存于元组中，另建单词到排名的哈希索引，排名查询为O(1)"""
+
+    def __init__(self, words: List[str]):
+        self._words = tuple(words)
+        self._ranks: Dict[str, int] = {}
+        for rank, word in enumerate(self._words, start=1):
+            self._ranks.setdefault(word, rank)
+
+    @classmethod
+    def load(cls, path: str) -> "WordFrequencyTable":
+        """从文本文件加载词频表，每行一个单词（可附带词频列），按词频从高到低排列"""
+        words = []
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    words.append(line.split()[0].lower())
+        except FileNotFoundError:
+            print(f"未找到词频表文件: {path}，难度等级将保持为unknown")
+        return cls(words)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def rank(self, word: str) -> Optional[int]:
+        """查询单词的词频排名，不在词表中时返回None"""
+        return self._ranks.get(word.lower())
+
+    @staticmethod
+    def difficulty_for_rank(rank: Optional[int]) -> str:
+        """根据词频排名计算难度等级"""
+        if rank is None:
+            return "unknown"
+        for max_rank, level in DIFFICULTY_THRESHOLDS:
+            if rank <= max_rank:
+                return level
+        return "rare"
+
+    def difficulty(self, word: str) -> str:
+        """查询单词的难度等级"""
+        return self.difficulty_for_rank(self.rank(word))
+
+# 全局词频表实例
+word_frequency_table = WordFrequencyTable.load(WORD_FREQUENCY_FILE)
+
+def backfill_word_frequency(db: Session) -> int:
+    """为尚无词频排名的已有单词批量回填排名和难度等级，返回更新的行数"""
+    if not len(word_frequency_table):
+        return 0
+
+    rows = db.query(Word.id, Word.word).filter(Word.frequency_rank.is_(None)).all()
+    updates = []
+    for word_id, word in rows:
+        rank = word_frequency_table.rank(word)
+        if rank is not None:
+            updates.append({
+                "id": word_id,
+                "frequency_rank": rank,
+                "difficulty_level": word_frequency_table.difficulty_for_rank(rank)
+            })
+
+    if updates:
+        # 一次executemany批量更新，避免逐行提交
+        db.bulk_update_mappings(Word, updates)
+        db.commit()
+    return len(updates)
+
+def run_word_frequency_backfill():
+    db = SessionLocal()
+    try:
+        updated = backfill_word_frequency(db)
+        if updated:
+            print(f"已回填 {updated} 个单词的词频排名")
+    finally:
+        db.close()
+
+run_word_frequency_backfill()
+
 # 依赖注入
 def get_db():
     db = SessionLocal()
@@ -491,6 +598,8 @@ async def add_word(word_data: WordCreate, db: Session = Depends(get_db)):
             definitions=json.loads(existing_word.definitions) if existing_word.definitions else [],
             examples=json.loads(existing_word.examples) if existing_word.examples else [],
             pos_tags=existing_word.pos_tags,
+            difficulty_level=existing_word.difficulty_level or "unknown",
+            frequency_rank=existing_word.frequency_rank,
             mastery_level=0,
             review_count=0,
             created_at=existing_word.created_at
@@ -503,11 +612,14 @@ async def add_word(word_data: WordCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="无法获取该单词的释义")
     
     # 创建新单词记录
+    frequency_rank = word_frequency_table.rank(word_data.word)
     new_word = Word(
         word=word_data.word.lower(),
         pronunciation=definition.pronunciation,
         definitions=json.dumps(definition.definitions),
         pos_tags=definition.pos_tags,
+        difficulty_level=word_frequency_table.difficulty_for_rank(frequency_rank),
+        frequency_rank=frequency_rank,
         examples=json.dumps(definition.examples)
     )
     
@@ -533,6 +645,8 @@ async def add_word(word_data: WordCreate, db: Session = Depends(get_db)):
         definitions=json.loads(new_word.definitions) if new_word.definitions else [],
         examples=json.loads(new_word.examples) if new_word.examples else [],
         pos_tags=new_word.pos_tags,
+        difficulty_level=new_word.difficulty_level or "unknown",
+        frequency_rank=new_word.frequency_rank,
         mastery_level=0,
         review_count=0,
         created_at=new_word.created_at
@@ -543,14 +657,23 @@ async def get_words(
     skip: int = 0, 
     limit: int = 100, 
     search: Optional[str] = None,
+    sort: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """获取生词列表"""
+    """获取生词列表，sort可选frequency（常用词优先）或-frequency（生僻词优先）"""
     query = db.query(Word)
     
     if search:
         query = query.filter(Word.word.contains(search.lower()))
     
+    # 按词频排序，走frequency_rank索引，无排名的单词排在最后
+    if sort == "frequency":
+        query = query.order_by(Word.frequency_rank.asc().nulls_last())
+    elif sort == "-frequency":
+        query = query.order_by(Word.frequency_rank.desc().nulls_last())
+    elif sort is not None:
+        raise HTTPException(status_code=400, detail="无效的排序方式")
+    
     words = query.offset(skip).limit(limit).all()
     
     result = []
@@ -565,6 +688,8 @@ async def get_words(
             definitions=json.loads(word.definitions) if word.definitions else [],
             examples=json.loads(word.examples) if word.examples else [],
             pos_tags=word.pos_tags,
+            difficulty_level=word.difficulty_level or "unknown",
+            frequency_rank=word.frequency_rank,
             mastery_level=latest_record.mastery_level if latest_record else 0,
             review_count=latest_record.review_count if latest_record else 0,
             created_at=word.created_at
@@ -32,6 +32,7 @@ export const vocabularyApi = {
     skip?: number;
     limit?: number;
     search?: string;
+    sort?: 'frequency' | '-frequency';
   }): Promise<Word[]> {
     const response = await api.get('/api/words', { params });
     return response.data;
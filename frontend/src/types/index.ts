@@ -11,6 +11,8 @@ export interface Word {
   definitions: WordDefinition[];
   examples: string[];
   pos_tags?: string;
+  difficulty_level: string;
+  frequency_rank?: number | null;
   mastery_level: number;
   review_count: number;
   created_at: string;